@@ -7,12 +7,82 @@
 
 import requests
 import json
+import copy
+import hashlib
+import os
+import tempfile
+import time
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+import pyarrow as pa
+from collections import OrderedDict
+
+# On-disk cache of fetched API logs, stored as Parquet files. The logs are
+# customer data, so the cache lives in a private per-user directory
+CACHE_DIR = os.environ.get(
+    'API_RESPONSE_ANALYSER_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'api_response_analyser')
+)
+CACHE_TTL_SECONDS = 3600  # Across processes; see fetch_api_logs for the in-process report cache
+
+# In-memory LRU cache of analysis reports, keyed by customer and date range
+_REPORT_CACHE = OrderedDict()
+_REPORT_CACHE_MAX_ENTRIES = 128
+_REPORT_CACHE_TTL_SECONDS = 300
 
 def fetch_api_logs(customer_id, start_date, end_date):
     """
-    Fetch API logs from database for the specified customer and date range.
+    Fetch API logs for the specified customer and date range.
+    Results are cached on disk as Parquet for CACHE_TTL_SECONDS, so repeated
+    requests for the same range skip the database query. Within one process,
+    analyse_api_responses also keeps reports for up to _REPORT_CACHE_TTL_SECONDS,
+    so an expired Parquet entry is only noticed once that report expires too;
+    CACHE_TTL_SECONDS applies in full across processes.
+    
+    Parameters:
+        customer_id (str): Unique identifier for the customer
+        start_date (str): Start date in format 'YYYY-MM-DD'
+        end_date (str): End date in format 'YYYY-MM-DD'
+        
+    Returns:
+        pd.DataFrame: API log entries, one row per request
+    """
+    cache_key = hashlib.sha1(f"{customer_id}|{start_date}|{end_date}".encode()).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{cache_key}.parquet")
+    
+    # The cache only ever saves time: if it can't be read or written, fall back
+    # to the query and carry on
+    try:
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) > time.time() - CACHE_TTL_SECONDS:
+            return pd.read_parquet(cache_path, engine='pyarrow')
+    except (OSError, pa.ArrowException) as e:
+        print(f"Ignoring unreadable API log cache entry {cache_path}: {e}")
+    
+    logs = query_api_logs(customer_id, start_date, end_date)
+    
+    # Write to a private temporary file first so readers never see a partially
+    # written cache entry
+    temp_path = None
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=CACHE_DIR)
+        os.close(temp_fd)
+        logs.to_parquet(temp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(temp_path, cache_path)
+    except (OSError, pa.ArrowException) as e:
+        print(f"Could not cache API logs in {CACHE_DIR}: {e}")
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    return logs
+
+
+def query_api_logs(customer_id, start_date, end_date):
+    """
+    Query API logs from database for the specified customer and date range.
     This would typically connect to your logging database.
     
     Parameters:
@@ -21,7 +91,7 @@ def fetch_api_logs(customer_id, start_date, end_date):
         end_date (str): End date in format 'YYYY-MM-DD'
         
     Returns:
-        list: Collection of API log entries
+        pd.DataFrame: API log entries, one row per request
     """
     # This is a placeholder - in production, this would query your logging system
     # Example implementation might use SQL:
@@ -33,21 +103,20 @@ def fetch_api_logs(customer_id, start_date, end_date):
     #     FROM api_logs
     #     WHERE customer_id = %s AND timestamp BETWEEN %s AND %s
     # """
-    # results = conn.execute(query, [customer_id, start_date, end_date])
-    # return results.fetchall()
-    
-    # For demonstration, return mock data
-    return [
-        {
-            'request_id': f'req-{i}',
-            'timestamp': datetime.strptime(start_date, '%Y-%m-%d') + timedelta(hours=i % 24),
-            'endpoint': f'/api/{"calls" if i % 3 == 0 else "users" if i % 3 == 1 else "integrations"}',
-            'status_code': 200 if i % 5 != 0 else 400 + (i % 3) * 10,
-            'response_time_ms': 150 + (i * 10) % 500,
-            'error_message': None if i % 5 != 0 else f'Error type {i % 3}'
-        }
-        for i in range(100)
-    ]
+    # return pd.read_sql(query, conn, params=[customer_id, start_date, end_date],
+    #                    parse_dates=['timestamp'])
+    
+    # For demonstration, return mock data built column by column
+    i = np.arange(100)
+    is_error = i % 5 == 0
+    return pd.DataFrame({
+        'request_id': np.char.add('req-', i.astype(str)),
+        'timestamp': pd.Timestamp(start_date) + pd.to_timedelta(i % 24, unit='h'),
+        'endpoint': np.array(['/api/calls', '/api/users', '/api/integrations'])[i % 3],
+        'status_code': np.where(is_error, 400 + (i % 3) * 10, 200),
+        'response_time_ms': 150 + (i * 10) % 500,
+        'error_message': np.where(is_error, np.char.add('Error type ', (i % 3).astype(str)), None)
+    })
 
 
 def analyse_api_responses(customer_id, start_date, end_date):
@@ -63,50 +132,90 @@ def analyse_api_responses(customer_id, start_date, end_date):
     Returns:
         dict: Analysis report with various metrics and error patterns
     """
-    # Fetch API logs from database
-    logs = fetch_api_logs(customer_id, start_date, end_date)
+    cache_key = (customer_id, start_date, end_date)
+    now = time.time()
+    
+    # New logs keep arriving for ranges that include today, so cached reports
+    # expire after a short while
+    cached = _REPORT_CACHE.get(cache_key)
+    if cached is not None and now - cached[0] <= _REPORT_CACHE_TTL_SECONDS:
+        _REPORT_CACHE.move_to_end(cache_key)
+        return copy.deepcopy(cached[1])
+    
+    report = _analyse_api_responses(customer_id, start_date, end_date)
+    
+    # Store a copy so callers can modify their report without corrupting the cached one
+    _REPORT_CACHE[cache_key] = (now, copy.deepcopy(report))
+    _REPORT_CACHE.move_to_end(cache_key)
+    while len(_REPORT_CACHE) > _REPORT_CACHE_MAX_ENTRIES:
+        _REPORT_CACHE.popitem(last=False)  # Evict the least recently used report
+    
+    return report
+
+
+def _analyse_api_responses(customer_id, start_date, end_date):
+    """
+    Build the analysis report for analyse_api_responses without consulting
+    the report cache.
+    """
+    # Fetch API logs from database, on Arrow-backed columns so groupbys run on
+    # pyarrow compute kernels and the frame can be shared with Arrow-native tools
+    df = fetch_api_logs(customer_id, start_date, end_date).convert_dtypes(dtype_backend='pyarrow')
+    # Status codes and response times fit comfortably in narrower integers, which
+    # cuts the bytes read by every mask and aggregation below
+    df = df.astype({'status_code': 'int16[pyarrow]', 'response_time_ms': 'int32[pyarrow]'})
     
-    # Convert to DataFrame for analysis
-    df = pd.DataFrame(logs)
+    # Flag failed requests once and reuse the mask for every error metric below
+    is_err = df['status_code'].to_numpy() >= 400
+    error_count = int(is_err.sum())
+    df['is_success'] = ~is_err
     
     # Analyse response codes
-    response_summary = df.groupby('status_code').agg({
-        'request_id': 'count',
-        'response_time_ms': ['mean', 'median', 'max']
-    }).reset_index()
+    response_summary = df.groupby('status_code').agg(
+        request_count=('request_id', 'count'),
+        avg_response_time_ms=('response_time_ms', 'mean'),
+        median_response_time_ms=('response_time_ms', 'median'),
+        max_response_time_ms=('response_time_ms', 'max')
+    ).reset_index()
     
     # Identify slow endpoints
-    endpoint_performance = df.groupby('endpoint').agg({
-        'request_id': 'count',
-        'response_time_ms': ['mean', 'median', 'max'],
-        'status_code': lambda x: (x < 400).mean() * 100  # Success rate percentage
-    }).reset_index()
+    endpoint_performance = df.groupby('endpoint').agg(
+        request_count=('request_id', 'count'),
+        avg_response_time_ms=('response_time_ms', 'mean'),
+        median_response_time_ms=('response_time_ms', 'median'),
+        max_response_time_ms=('response_time_ms', 'max'),
+        success_rate=('is_success', 'mean')
+    ).reset_index()
+    endpoint_performance['success_rate'] *= 100  # Success rate percentage
     
     # Analyse error patterns
-    error_df = df[df['status_code'] >= 400]
+    error_df = df[is_err]
     error_patterns = {}
     
     if not error_df.empty:
         error_patterns = error_df.groupby(['endpoint', 'error_message']).size().reset_index(name='count')
         error_patterns = error_patterns.sort_values('count', ascending=False)
     
-    # Time-based pattern analysis
-    df['hour_of_day'] = df['timestamp'].dt.hour
-    hourly_errors = df[df['status_code'] >= 400].groupby('hour_of_day').size()
+    # Time-based pattern analysis over a fixed 24-bin hour-of-day histogram
+    error_hours = df['timestamp'].dt.hour.to_numpy().astype(np.int8)[is_err]
+    hourly_counts = np.bincount(error_hours, minlength=24)
+    hourly_errors = {hour: int(count) for hour, count in enumerate(hourly_counts) if count}
     
     # Look for correlation between response time and errors
     time_vs_errors = {}
     if not error_df.empty:
-        time_thresholds = [100, 250, 500, 1000, float('inf')]
-        for i in range(len(time_thresholds)-1):
-            lower = time_thresholds[i]
-            upper = time_thresholds[i+1]
-            time_range = f"{lower}-{upper if upper != float('inf') else '+'}"
-            count_in_range = len(df[(df['response_time_ms'] > lower) & 
-                                   (df['response_time_ms'] <= upper)])
-            errors_in_range = len(df[(df['response_time_ms'] > lower) & 
-                                    (df['response_time_ms'] <= upper) & 
-                                    (df['status_code'] >= 400)])
+        # Bucket i covers the range (bins[i-1], bins[i]]; bucket 0 is below the first threshold
+        bins = np.array([100, 250, 500, 1000, np.inf])
+        bucket_idx = np.searchsorted(bins, df['response_time_ms'].to_numpy(), side='left')
+        bucket_totals = np.bincount(bucket_idx, minlength=len(bins))
+        bucket_errors = np.bincount(bucket_idx, weights=is_err, minlength=len(bins))
+        
+        for bucket in range(1, len(bins)):
+            count_in_range = int(bucket_totals[bucket])
+            errors_in_range = int(bucket_errors[bucket])
+            lower = bins[bucket - 1]
+            upper = bins[bucket]
+            time_range = f"{lower:.0f}-{upper:.0f}" if np.isfinite(upper) else f"{lower:.0f}-+"
             
             if count_in_range > 0:
                 error_rate = errors_in_range / count_in_range * 100
@@ -128,14 +237,14 @@ def analyse_api_responses(customer_id, start_date, end_date):
         },
         'overall_metrics': {
             'total_requests': len(df),
-            'success_rate': (df['status_code'] < 400).mean() * 100,
+            'success_rate': df['is_success'].mean() * 100,
             'average_response_time': df['response_time_ms'].mean(),
-            'error_count': len(df[df['status_code'] >= 400])
+            'error_count': error_count
         },
         'response_code_summary': response_summary.to_dict(),
         'endpoint_performance': endpoint_performance.to_dict(),
         'top_errors': error_patterns.to_dict() if isinstance(error_patterns, pd.DataFrame) else {},
-        'hourly_error_distribution': hourly_errors.to_dict(),
+        'hourly_error_distribution': hourly_errors,
         'response_time_vs_errors': time_vs_errors
     }
     
@@ -144,20 +253,20 @@ def analyse_api_responses(customer_id, start_date, end_date):
     
     # High error rates for specific endpoints
     if isinstance(endpoint_performance, pd.DataFrame) and not endpoint_performance.empty:
-        problem_endpoints = endpoint_performance[endpoint_performance['status_code'] < 95]
-        for _, row in problem_endpoints.iterrows():
-            recommendations.append(f"Investigate high error rate ({100-row['status_code']:.1f}%) for endpoint: {row['endpoint']}")
+        problem_endpoints = endpoint_performance[endpoint_performance['success_rate'] < 95]
+        for endpoint, success_rate in problem_endpoints[['endpoint', 'success_rate']].itertuples(index=False, name=None):
+            recommendations.append(f"Investigate high error rate ({100-success_rate:.1f}%) for endpoint: {endpoint}")
     
     # Slow endpoints
     if isinstance(endpoint_performance, pd.DataFrame) and not endpoint_performance.empty:
-        slow_endpoints = endpoint_performance[endpoint_performance[('response_time_ms', 'mean')] > 300]
-        for _, row in slow_endpoints.iterrows():
-            recommendations.append(f"Optimise performance for slow endpoint: {row['endpoint']} (avg: {row[('response_time_ms', 'mean')]:.0f}ms)")
+        slow_endpoints = endpoint_performance[endpoint_performance['avg_response_time_ms'] > 300]
+        for endpoint, avg_response_time in slow_endpoints[['endpoint', 'avg_response_time_ms']].itertuples(index=False, name=None):
+            recommendations.append(f"Optimise performance for slow endpoint: {endpoint} (avg: {avg_response_time:.0f}ms)")
     
     # Time-based issues
-    if len(hourly_errors) > 0:
-        peak_hour = hourly_errors.idxmax()
-        peak_count = hourly_errors.max()
+    if hourly_errors:
+        peak_hour = int(hourly_counts.argmax())
+        peak_count = int(hourly_counts[peak_hour])
         if peak_count > len(df) * 0.1:  # If peak hour has >10% of all errors
             recommendations.append(f"Investigate potential issues during peak error hour: {peak_hour}:00")
     
@@ -10,17 +10,132 @@
 # - Analyses error distribution by hour to identify patterns
 # - Generates comprehensive reports for further analysis
 
+import copy
+import mmap
+from array import array
 import re
+import numpy as np
 import pandas as pd
-from collections import Counter
+from collections import Counter, OrderedDict
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 import os
+import time
+
+# Regex patterns for log parsing, compiled once at import time.
+# A single match per line captures the timestamp (first bracketed field)
+# and, when it directly follows, the log level. The line pattern is anchored
+# to line starts so the whole file can be scanned with finditer.
+_LINE_RE = re.compile(
+    rb'^[^\[\n]*\[(?P<ts>[^\]\n]+)\][ \t]*(?:\[(?P<lvl>INFO|WARNING|ERROR|CRITICAL)\])?',
+    re.MULTILINE
+)
+# Fallback for lines where the level doesn't directly follow the timestamp
+_LEVEL_RE = re.compile(rb'\[(INFO|WARNING|ERROR|CRITICAL)\]')
+_ERROR_RE = re.compile(r'ERROR.*?:\s(.*?)(?:\n|$)')
+
+# Rules used to normalise error messages so similar errors group together,
+# applied in order
+_NORMALISATION_RULES = (
+    (re.compile(r'[0-9a-f-]{36}'), '<UUID>'),                                           # 1. UUIDs
+    (re.compile(r'\b\d+\b'), '<NUM>'),                                                  # 2. Numbers
+    (re.compile(r'\/[\w\/\.-]+'), '<PATH>'),                                            # 3. File paths
+    (re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b'), '<IP>'),                               # 4. IP addresses
+    (re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'), '<EMAIL>'),    # 5. Email addresses
+)
+
+# Below this many error messages, pattern counting skips pandas entirely
+SMALL_LOG_THRESHOLD = 5000
+
+# In-memory LRU cache of analysis reports, keyed by file version and time window
+_LOG_REPORT_CACHE = OrderedDict()
+_LOG_CACHE_MAX_ENTRIES = 32
+_LOG_CACHE_TTL_SECONDS = 300
+_LOG_CACHE_MIN_FILE_AGE_SECONDS = 60
+
+# Supported timestamp formats - adjust as needed for your logs
+TIMESTAMP_FORMATS = [
+    '%Y-%m-%d %H:%M:%S,%f',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%d/%b/%Y:%H:%M:%S'
+]
+
+# Reference points for storing timestamps as int64 microseconds
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Exact shapes of the ISO 8601 formats. A string of one of these shapes is
+# parsed field by field, which gives the same result as strptime at a fraction
+# of the cost; any other string is left to strptime.
+_ISO_FORMAT_RES = {
+    '%Y-%m-%d %H:%M:%S,%f': re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2}),(\d{1,6})', re.ASCII),
+    '%Y-%m-%d %H:%M:%S.%f': re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})\.(\d{1,6})', re.ASCII),
+    '%Y-%m-%d %H:%M:%S': re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})', re.ASCII)
+}
+
+def _parse_timestamp(timestamp_str, fmt):
+    """
+    Parse a timestamp string using the given format
+    
+    Accepts exactly the strings datetime.strptime accepts for fmt, and is used
+    both when detecting the format and for every line after that.
+    
+    Args:
+        timestamp_str (str): Timestamp text extracted from a log line
+        fmt (str): One of TIMESTAMP_FORMATS
+    
+    Returns:
+        datetime: Parsed (naive) timestamp
+    
+    Raises:
+        ValueError: If the string does not match the format
+    """
+    shape = _ISO_FORMAT_RES.get(fmt)
+    if shape is not None:
+        shape_match = shape.fullmatch(timestamp_str)
+        if shape_match:
+            fields = shape_match.groups()
+            microsecond = int(fields[6].ljust(6, '0')) if len(fields) > 6 else 0
+            return datetime(*map(int, fields[:6]), microsecond)
+    return datetime.strptime(timestamp_str, fmt)
+
+def _find_bursts(timestamps_ns, max_gap_ns, min_count):
+    """
+    Find runs of closely spaced events in a sorted array of timestamps
+    
+    Consecutive events belong to the same run while the gap between them is
+    at most max_gap_ns. Works purely on int64 arrays, so no Python objects
+    are touched per event.
+    
+    Args:
+        timestamps_ns (numpy.ndarray): Sorted int64 timestamps in nanoseconds
+        max_gap_ns (int): Largest gap (ns) allowed between events in one run
+        min_count (int): Minimum number of events for a run to count as a burst
+    
+    Returns:
+        tuple: Arrays (start_idx, end_idx, count) for each burst, end_idx inclusive
+    """
+    n = len(timestamps_ns)
+    if n == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+    
+    breaks = np.flatnonzero(np.diff(timestamps_ns) > max_gap_ns) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [n])) - 1
+    counts = ends - starts + 1
+    
+    is_burst = counts >= min_count
+    return starts[is_burst], ends[is_burst], counts[is_burst]
 
 def analyse_log_file(log_file_path, time_window=24):
     """
     Analyse a log file to identify error patterns within a specific time window
     
+    Reports are cached per file version (path, modification time and size) and
+    time window, so repeated requests for an unchanged file are served from memory.
+    
     Args:
         log_file_path (str): Path to the log file
         time_window (int): Hours to look back from now
@@ -31,13 +146,52 @@ def analyse_log_file(log_file_path, time_window=24):
     if not os.path.exists(log_file_path):
         return {"error": f"Log file not found: {log_file_path}"}
     
-    # Define regex patterns for log parsing
-    timestamp_pattern = r'\[(.*?)\]'
-    level_pattern = r'\[(INFO|WARNING|ERROR|CRITICAL)\]'
-    error_pattern = r'ERROR.*?:\s(.*?)(?:\n|$)'
+    file_stat = os.stat(log_file_path)
+    cache_key = (os.path.abspath(log_file_path), file_stat.st_mtime, file_stat.st_size, time_window)
+    now = time.time()
+    
+    # The time window is relative to now, so cached reports expire after a short while
+    cached = _LOG_REPORT_CACHE.get(cache_key)
+    if cached is not None and now - cached[0] <= _LOG_CACHE_TTL_SECONDS:
+        _LOG_REPORT_CACHE.move_to_end(cache_key)
+        return copy.deepcopy(cached[1])
+    
+    report = _analyse_log_file(log_file_path, time_window)
+    
+    # Don't cache failures, or files that are still being written to
+    if 'error' not in report and now - file_stat.st_mtime > _LOG_CACHE_MIN_FILE_AGE_SECONDS:
+        _LOG_REPORT_CACHE[cache_key] = (now, copy.deepcopy(report))
+        _LOG_REPORT_CACHE.move_to_end(cache_key)
+        while len(_LOG_REPORT_CACHE) > _LOG_CACHE_MAX_ENTRIES:
+            _LOG_REPORT_CACHE.popitem(last=False)  # Evict the least recently used report
+    
+    return report
+
+def _analyse_log_file(log_file_path, time_window):
+    """
+    Parse and analyse a log file without consulting the report cache
     
+    The file is read in two passes. The first streams every line but keeps only
+    counters plus the time and file offset of each error line; the second
+    revisits just those error lines to extract their messages. Memory therefore
+    grows with the number of errors rather than the size of the log.
+    
+    Args:
+        log_file_path (str): Path to an existing log file
+        time_window (int): Hours to look back from now
+    
+    Returns:
+        dict: Analysis report containing error statistics and patterns
+    """
     # Initialise data structures
-    log_entries = []
+    total_logs = 0
+    level_counts = Counter()
+    error_times_us = array('q')  # Microseconds since the epoch, one per error line
+    error_offsets = array('q')   # Byte offset of each error line in the file
+    error_msgs = []
+    
+    # Timestamp format detected on the first parsable line, reused for the rest
+    chosen_fmt = None
     
     # Calculate time threshold
     time_threshold = datetime.now() - timedelta(hours=time_window)
@@ -47,29 +201,31 @@ def analyse_log_file(log_file_path, time_window=24):
     print(f"Looking at entries from the past {time_window} hours")
     
     try:
-        with open(log_file_path, 'r') as file:
-            for line_number, line in enumerate(file, 1):
-                # Extract timestamp
-                timestamp_match = re.search(timestamp_pattern, line)
-                if timestamp_match:
+        # mmap cannot map an empty file, and an empty file has no entries anyway
+        if os.path.getsize(log_file_path) > 0:
+            with open(log_file_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as log_data:
+                # Pass 1: extract timestamp and log level straight from the mapped bytes
+                for line_match in _LINE_RE.finditer(log_data):
                     try:
-                        # Try different timestamp formats - adjust as needed for your logs
-                        timestamp_formats = [
-                            '%Y-%m-%d %H:%M:%S,%f',
-                            '%Y-%m-%d %H:%M:%S.%f',
-                            '%Y-%m-%d %H:%M:%S',
-                            '%d/%b/%Y:%H:%M:%S'
-                        ]
-                        
-                        timestamp_str = timestamp_match.group(1)
+                        timestamp_str = line_match.group('ts').decode('utf-8', errors='replace')
                         timestamp = None
                         
-                        for fmt in timestamp_formats:
+                        # Try the format that worked last time before probing the others
+                        if chosen_fmt is not None:
                             try:
-                                timestamp = datetime.strptime(timestamp_str, fmt)
-                                break
+                                timestamp = _parse_timestamp(timestamp_str, chosen_fmt)
                             except ValueError:
-                                continue
+                                chosen_fmt = None
+                        
+                        if timestamp is None:
+                            for fmt in TIMESTAMP_FORMATS:
+                                try:
+                                    timestamp = _parse_timestamp(timestamp_str, fmt)
+                                    chosen_fmt = fmt
+                                    break
+                                except ValueError:
+                                    continue
                         
                         if timestamp is None:
                             # If all formats failed, skip this line
@@ -78,131 +234,82 @@ def analyse_log_file(log_file_path, time_window=24):
                         # Skip if outside time window
                         if timestamp < time_threshold:
                             continue
-                            
-                        # Extract log level
-                        level_match = re.search(level_pattern, line)
-                        level = level_match.group(1) if level_match else 'UNKNOWN'
                         
-                        # Extract error message for ERROR logs
-                        error_msg = None
-                        if level == 'ERROR' or level == 'CRITICAL':
-                            error_match = re.search(error_pattern, line)
-                            if error_match:
-                                error_msg = error_match.group(1)
-                            elif 'ERROR' in line or 'CRITICAL' in line:
-                                # If regex failed but it's an error, get everything after the level marker
-                                parts = line.split(f"[{level}]", 1)
-                                if len(parts) > 1:
-                                    error_msg = parts[1].strip()
+                        level = _line_level(log_data, line_match)
                         
                         # Add to our data
-                        log_entries.append({
-                            'timestamp': timestamp,
-                            'level': level,
-                            'error_msg': error_msg,
-                            'raw_log': line.strip(),
-                            'line_number': line_number
-                        })
+                        total_logs += 1
+                        level_counts[level] += 1
+                        if level == 'ERROR' or level == 'CRITICAL':
+                            error_times_us.append((timestamp - _EPOCH) // _ONE_MICROSECOND)
+                            error_offsets.append(line_match.start())
                     except Exception as e:
+                        line_number = log_data[:line_match.start()].count(b'\n') + 1
                         print(f"Error parsing line {line_number}: {e}")
                         continue
+                
+                # Pass 2: revisit only the error lines, in file order, for their messages
+                for offset in error_offsets:
+                    error_msgs.append(_extract_error_message(log_data, offset))
+                
+                # Burst detection needs the errors in time order, which can differ
+                # from file order; pattern counting keeps file order
+                error_order = np.argsort(np.frombuffer(error_times_us, dtype=np.int64), kind='stable')
+                error_times = np.frombuffer(error_times_us, dtype='datetime64[us]')[error_order]
     except Exception as e:
         return {"error": f"Failed to process log file: {str(e)}"}
     
     # If no entries were found, return early
-    if not log_entries:
+    if total_logs == 0:
         return {
             "warning": "No log entries found within the specified time window",
             "total_logs": 0,
             "error_logs": 0
         }
     
-    # Convert to DataFrame for analysis
-    log_df = pd.DataFrame(log_entries)
-    
     # Basic statistics
-    total_logs = len(log_df)
-    error_count = len(log_df[(log_df['level'] == 'ERROR') | (log_df['level'] == 'CRITICAL')])
-    
-    # Error type frequency analysis
-    error_types = Counter()
-    normalised_to_original = {}  # To keep track of normalising
-    
-    for error in log_df[(log_df['level'] == 'ERROR') | (log_df['level'] == 'CRITICAL')]['error_msg'].dropna():
-        # Normalise error message to group similar errors
-        # 1. Replace UUIDs with <UUID>
-        normalised_error = re.sub(r'[0-9a-f-]{36}', '<UUID>', error)
-        # 2. Replace numbers with <NUM>
-        normalised_error = re.sub(r'\b\d+\b', '<NUM>', normalised_error)
-        # 3. Replace file paths with <PATH>
-        normalised_error = re.sub(r'\/[\w\/\.-]+', '<PATH>', normalised_error)
-        # 4. Replace IP addresses with <IP>
-        normalised_error = re.sub(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', '<IP>', normalised_error)
-        # 5. Replace email addresses with <EMAIL>
-        normalised_error = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '<EMAIL>', normalised_error)
-        
-        error_types[normalised_error] += 1
-        normalised_to_original[normalised_error] = error  # Store original example
+    error_count = len(error_times)
     
-    # Error time distribution
-    log_df['hour'] = log_df['timestamp'].dt.hour
-    hourly_errors = log_df[(log_df['level'] == 'ERROR') | (log_df['level'] == 'CRITICAL')].groupby('hour').size()
+    # Error type frequency analysis. For small volumes pandas' fixed setup cost
+    # outweighs its vectorised speed-up, so plain Python containers are used instead
+    present_msgs = [error_msg for error_msg in error_msgs if error_msg is not None]
+    if len(present_msgs) < SMALL_LOG_THRESHOLD:
+        error_type_counts, error_examples = _count_error_patterns(present_msgs)
+    else:
+        error_type_counts, error_examples = _count_error_patterns_pandas(present_msgs)
+    
+    # Error time distribution over a fixed 24-bin hour-of-day histogram
+    error_hours = error_times.astype('datetime64[h]').astype(np.int64) % 24
+    hourly_counts = np.bincount(error_hours, minlength=24)
+    hourly_errors = {hour: int(count) for hour, count in enumerate(hourly_counts) if count}
     
     # Log level distribution
-    level_counts = log_df['level'].value_counts().to_dict()
+    level_counts = dict(level_counts.most_common())
     
     # Identify error bursts (multiple errors in short time periods)
-    error_df = log_df[(log_df['level'] == 'ERROR') | (log_df['level'] == 'CRITICAL')]
     error_bursts = []
     
-    if not error_df.empty:
-        # Sort by timestamp
-        error_df = error_df.sort_values('timestamp')
-        
+    if error_count > 0:
         # Define what constitutes a "burst" (e.g., 5+ errors within 5 minutes)
         burst_threshold = 5
         time_threshold_minutes = 5
         
-        # Initialise variables
-        current_burst = []
-        
-        # Iterate through errors to find bursts
-        for i in range(len(error_df)):
-            if i == 0:
-                current_burst = [i]
-                continue
-                
-            current_time = error_df.iloc[i]['timestamp']
-            previous_time = error_df.iloc[current_burst[-1]]['timestamp']
-            
-            # If this error is within the time threshold of the previous one, add to current burst
-            if (current_time - previous_time).total_seconds() / 60 <= time_threshold_minutes:
-                current_burst.append(i)
-            else:
-                # If we had a burst, record it
-                if len(current_burst) >= burst_threshold:
-                    start_time = error_df.iloc[current_burst[0]]['timestamp']
-                    end_time = error_df.iloc[current_burst[-1]]['timestamp']
-                    error_bursts.append({
-                        'start_time': start_time,
-                        'end_time': end_time,
-                        'duration_minutes': (end_time - start_time).total_seconds() / 60,
-                        'error_count': len(current_burst),
-                        'sample_errors': error_df.iloc[current_burst[:3]]['error_msg'].tolist()
-                    })
-                # Start a new burst
-                current_burst = [i]
+        # error_times is sorted by timestamp
+        starts, ends, counts = _find_bursts(
+            error_times.astype('datetime64[ns]').view(np.int64),
+            time_threshold_minutes * 60 * 10**9,
+            burst_threshold
+        )
         
-        # Check if the last group is a burst
-        if len(current_burst) >= burst_threshold:
-            start_time = error_df.iloc[current_burst[0]]['timestamp']
-            end_time = error_df.iloc[current_burst[-1]]['timestamp']
+        for start, end, count in zip(starts, ends, counts):
+            start_time = error_times[start].item()
+            end_time = error_times[end].item()
             error_bursts.append({
                 'start_time': start_time,
                 'end_time': end_time,
                 'duration_minutes': (end_time - start_time).total_seconds() / 60,
-                'error_count': len(current_burst),
-                'sample_errors': error_df.iloc[current_burst[:3]]['error_msg'].tolist()
+                'error_count': int(count),
+                'sample_errors': [error_msgs[i] for i in error_order[start:start + 3]]
             })
     
     # Generate comprehensive report
@@ -215,11 +322,11 @@ def analyse_log_file(log_file_path, time_window=24):
                 'pattern': error,
                 'count': count,
                 'percentage': (count / error_count) * 100 if error_count > 0 else 0,
-                'example': normalised_to_original.get(error, 'No example available')
+                'example': error_examples.get(error, 'No example available')
             }
-            for error, count in error_types.most_common(10)
+            for error, count in error_type_counts[:10]
         ],
-        'hourly_error_distribution': hourly_errors.to_dict(),
+        'hourly_error_distribution': hourly_errors,
         'level_distribution': level_counts,
         'error_bursts': error_bursts
     }
@@ -229,7 +336,7 @@ def analyse_log_file(log_file_path, time_window=24):
     
     # High frequency errors
     if error_count > 0:
-        top_errors = error_types.most_common(3)
+        top_errors = error_type_counts[:3]
         for error, count in top_errors:
             if count > 5:  # Threshold for "significant" errors
                 percentage = (count / error_count) * 100
@@ -242,9 +349,9 @@ def analyse_log_file(log_file_path, time_window=24):
             recommendations.append(f"  Burst {i}: {burst['error_count']} errors in {burst['duration_minutes']:.1f} minutes at {burst['start_time'].strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Time-based patterns
-    if not hourly_errors.empty:
-        peak_hour = hourly_errors.idxmax()
-        peak_count = hourly_errors.max()
+    if hourly_errors:
+        peak_hour = max(hourly_errors, key=hourly_errors.get)
+        peak_count = hourly_errors[peak_hour]
         if peak_count > error_count * 0.3:  # If >30% of errors occur in one hour
             recommendations.append(f"Check for scheduled jobs at hour {peak_hour}:00 that may be causing {peak_count} errors ({(peak_count/error_count)*100:.1f}% of total)")
     
@@ -252,6 +359,131 @@ def analyse_log_file(log_file_path, time_window=24):
     
     return report
 
+def _line_level(log_data, line_match):
+    """
+    Determine the log level of a line matched by _LINE_RE
+    
+    Args:
+        log_data (mmap.mmap): Memory-mapped log file
+        line_match (re.Match): Match of _LINE_RE at the start of the line
+    
+    Returns:
+        str: Log level, or 'UNKNOWN' if the line has none
+    """
+    level = line_match.group('lvl')
+    if level is None:
+        # The level doesn't directly follow the timestamp, so search the rest of the line
+        line_end = log_data.find(b'\n', line_match.end())
+        if line_end == -1:
+            line_end = len(log_data)
+        level_match = _LEVEL_RE.search(log_data, line_match.end(), line_end)
+        if level_match is None:
+            return 'UNKNOWN'
+        level = level_match.group(1)
+    return level.decode('ascii')
+
+def _extract_error_message(log_data, line_start):
+    """
+    Extract the error message from an ERROR or CRITICAL line of a mapped log file
+    
+    Args:
+        log_data (mmap.mmap): Memory-mapped log file
+        line_start (int): Byte offset at which the line starts
+    
+    Returns:
+        str: Error message, or None if none could be found
+    """
+    line_end = log_data.find(b'\n', line_start)
+    if line_end == -1:
+        line_end = len(log_data)
+    line = log_data[line_start:line_end].decode('utf-8', errors='replace').rstrip('\r')
+    
+    error_match = _ERROR_RE.search(line)
+    if error_match:
+        return error_match.group(1)
+    
+    if 'ERROR' in line or 'CRITICAL' in line:
+        # If regex failed but it's an error, get everything after the level marker
+        level = _line_level(log_data, _LINE_RE.match(log_data, line_start))
+        parts = line.split(f"[{level}]", 1)
+        if len(parts) > 1:
+            return parts[1].strip()
+    return None
+
+def _normalise_error(error_msg):
+    """
+    Normalise an error message so similar errors group together
+    
+    Args:
+        error_msg (str): Original error message
+    
+    Returns:
+        str: Message with UUIDs, numbers, paths, IPs and emails replaced by placeholders
+    """
+    for pattern, token in _NORMALISATION_RULES:
+        error_msg = pattern.sub(token, error_msg)
+    return error_msg
+
+def _count_error_patterns(error_msgs):
+    """
+    Count normalised error patterns using plain Python containers
+    
+    Used for small volumes, where building pandas objects costs more than the counting itself.
+    
+    Args:
+        error_msgs (list): Error messages in file order
+    
+    Returns:
+        tuple: List of (pattern, count) pairs, most common first, and a dict
+               mapping each pattern to its most recent original message
+    """
+    error_type_counts = Counter()
+    error_examples = {}
+    normalised_cache = {}  # Logs repeat the same message many times
+    
+    for error_msg in error_msgs:
+        normalised_error = normalised_cache.get(error_msg)
+        if normalised_error is None:
+            normalised_error = normalised_cache[error_msg] = _normalise_error(error_msg)
+        error_type_counts[normalised_error] += 1
+        error_examples[normalised_error] = error_msg  # Keep the most recent example
+    
+    return error_type_counts.most_common(), error_examples
+
+def _count_error_patterns_pandas(error_msgs):
+    """
+    Count normalised error patterns using vectorised pandas operations
+    
+    Args:
+        error_msgs (list): Error messages in file order
+    
+    Returns:
+        tuple: Same structure as _count_error_patterns
+    """
+    error_msgs = pd.Series(error_msgs, dtype=object)
+    
+    # Normalise error messages to group similar errors. Logs repeat the same
+    # message many times, so each distinct message is normalised only once
+    # (one vectorised pass per rule) and the result mapped back onto every row
+    distinct_errors = pd.Series(error_msgs.unique(), dtype=object)
+    normalised_distinct = distinct_errors
+    for pattern, token in _NORMALISATION_RULES:
+        normalised_distinct = normalised_distinct.str.replace(pattern, token, regex=True)
+    normalised_errors = error_msgs.map(dict(zip(distinct_errors, normalised_distinct)))
+    
+    error_type_counts = normalised_errors.value_counts()
+    # Keep the most recent original message for each pattern as an example
+    error_examples = (
+        pd.DataFrame({'pattern': normalised_errors, 'example': error_msgs})
+        .drop_duplicates('pattern', keep='last')
+        .set_index('pattern')['example']
+    )
+    
+    return (
+        [(error, int(count)) for error, count in error_type_counts.items()],
+        error_examples.to_dict()
+    )
+
 def plot_error_distribution(report, output_path=None):
     """
     Generate visualisations of error patterns from the analysis report